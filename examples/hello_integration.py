@@ -1,13 +1,13 @@
 #!/usr/bin/env python3
 """Hello world integration example. Bare minimum of an integration driver."""
-import asyncio
 import logging
 from typing import Any
 
 import ucapi
 
-loop = asyncio.get_event_loop()
-api = ucapi.IntegrationAPI(loop)
+loop = ucapi.new_event_loop()
+# This example is ready all the time: the device state is always CONNECTED
+api = ucapi.IntegrationAPI(loop, default_device_state=ucapi.DeviceStates.CONNECTED)
 
 
 async def cmd_handler(
@@ -28,14 +28,9 @@ async def cmd_handler(
     return ucapi.StatusCodes.OK
 
 
-@api.listens_to(ucapi.Events.CONNECT)
-async def on_connect() -> None:
-    # When the remote connects, we just set the device state. We are ready all the time!
-    await api.set_device_state(ucapi.DeviceStates.CONNECTED)
-
-
 if __name__ == "__main__":
     logging.basicConfig()
+    logging.getLogger("ucapi").setLevel(logging.DEBUG)
 
     button = ucapi.Button(
         "button1",
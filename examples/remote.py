@@ -1,10 +1,9 @@
 #!/usr/bin/env python3
 """Remote entity integration example. Bare minimum of an integration driver."""
-import asyncio
 import json
 import logging
 import sys
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 import ucapi
 from ucapi import remote
@@ -20,8 +19,9 @@ from ucapi.ui import (
     create_ui_text,
 )
 
-loop = asyncio.get_event_loop()
-api = ucapi.IntegrationAPI(loop)
+loop = ucapi.new_event_loop()
+# This example is ready all the time: the device state is always CONNECTED
+api = ucapi.IntegrationAPI(loop, default_device_state=ucapi.DeviceStates.CONNECTED)
 
 # Simple commands which are supported by this example remote-entity
 supported_commands = [
@@ -43,6 +43,81 @@ supported_commands = [
     "FORWARD",
     "RECORD",
 ]
+# Set for a constant time lookup in the command handler. The list is kept for the
+# entity's simple_commands option, which is sent in the given order.
+supported_commands_set = frozenset(supported_commands)
+
+
+def _set_state(entity: ucapi.Remote, state: remote.States) -> None:
+    api.configured_entities.update_attributes(
+        entity.id, {remote.Attributes.STATE: state}
+    )
+
+
+async def _handle_on(
+    entity: ucapi.Remote, _params: dict[str, Any] | None
+) -> ucapi.StatusCodes:
+    _set_state(entity, remote.States.ON)
+    return ucapi.StatusCodes.OK
+
+
+async def _handle_off(
+    entity: ucapi.Remote, _params: dict[str, Any] | None
+) -> ucapi.StatusCodes:
+    _set_state(entity, remote.States.OFF)
+    return ucapi.StatusCodes.OK
+
+
+async def _handle_toggle(
+    entity: ucapi.Remote, _params: dict[str, Any] | None
+) -> ucapi.StatusCodes:
+    if entity.attributes[remote.Attributes.STATE] == remote.States.OFF:
+        _set_state(entity, remote.States.ON)
+    else:
+        _set_state(entity, remote.States.OFF)
+    return ucapi.StatusCodes.OK
+
+
+async def _handle_send_cmd(
+    _entity: ucapi.Remote, params: dict[str, Any] | None
+) -> ucapi.StatusCodes:
+    command = params.get("command")
+    # It's up to the integration what to do with an unknown command.
+    # If the supported commands are provided as simple_commands, then it's
+    # easy to validate.
+    if command not in supported_commands_set:
+        print(f"Unknown command: {command}", file=sys.stderr)
+        return ucapi.StatusCodes.BAD_REQUEST
+
+    repeat = params.get("repeat", 1)
+    delay = params.get("delay", 0)
+    hold = params.get("hold", 0)
+    print(f"Command: {command} (repeat={repeat}, delay={delay}, hold={hold})")
+    return ucapi.StatusCodes.OK
+
+
+async def _handle_send_cmd_sequence(
+    _entity: ucapi.Remote, params: dict[str, Any] | None
+) -> ucapi.StatusCodes:
+    sequence = params.get("sequence")
+    repeat = params.get("repeat", 1)
+    delay = params.get("delay", 0)
+    hold = params.get("hold", 0)
+    print(f"Command sequence: {sequence} (repeat={repeat}, delay={delay}, hold={hold})")
+    return ucapi.StatusCodes.OK
+
+
+# Command dispatch table: entity command identifier -> handler
+_CMD_HANDLERS: dict[
+    str,
+    Callable[[ucapi.Remote, dict[str, Any] | None], Awaitable[ucapi.StatusCodes]],
+] = {
+    remote.Commands.ON: _handle_on,
+    remote.Commands.OFF: _handle_off,
+    remote.Commands.TOGGLE: _handle_toggle,
+    remote.Commands.SEND_CMD: _handle_send_cmd,
+    remote.Commands.SEND_CMD_SEQUENCE: _handle_send_cmd_sequence,
+}
 
 
 async def cmd_handler(
@@ -60,55 +135,12 @@ async def cmd_handler(
     """
     print(f"Got {entity.id} command request: {cmd_id}")
 
-    state = None
-    match cmd_id:
-        case remote.Commands.ON:
-            state = remote.States.ON
-        case remote.Commands.OFF:
-            state = remote.States.OFF
-        case remote.Commands.TOGGLE:
-            if entity.attributes[remote.Attributes.STATE] == remote.States.OFF:
-                state = remote.States.ON
-            else:
-                state = remote.States.OFF
-        case remote.Commands.SEND_CMD:
-            command = params.get("command")
-            # It's up to the integration what to do with an unknown command.
-            # If the supported commands are provided as simple_commands, then it's
-            # easy to validate.
-            if command not in supported_commands:
-                print(f"Unknown command: {command}", file=sys.stderr)
-                return ucapi.StatusCodes.BAD_REQUEST
-
-            repeat = params.get("repeat", 1)
-            delay = params.get("delay", 0)
-            hold = params.get("hold", 0)
-            print(f"Command: {command} (repeat={repeat}, delay={delay}, hold={hold})")
-        case remote.Commands.SEND_CMD_SEQUENCE:
-            sequence = params.get("sequence")
-            repeat = params.get("repeat", 1)
-            delay = params.get("delay", 0)
-            hold = params.get("hold", 0)
-            print(
-                f"Command sequence: {sequence} (repeat={repeat}, delay={delay}, hold={hold})"
-            )
-        case _:
-            print(f"Unsupported command: {cmd_id}", file=sys.stderr)
-            return ucapi.StatusCodes.BAD_REQUEST
-
-    if state:
-        api.configured_entities.update_attributes(
-            entity.id, {remote.Attributes.STATE: state}
-        )
-
-    return ucapi.StatusCodes.OK
-
+    handler = _CMD_HANDLERS.get(cmd_id)
+    if handler is None:
+        print(f"Unsupported command: {cmd_id}", file=sys.stderr)
+        return ucapi.StatusCodes.BAD_REQUEST
 
-@api.listens_to(ucapi.Events.CONNECT)
-async def on_connect() -> None:
-    """When the UCR2 connects, send the device state."""
-    # This example is ready all the time!
-    await api.set_device_state(ucapi.DeviceStates.CONNECTED)
+    return await handler(entity, params)
 
 
 def create_button_mappings() -> list[DeviceButtonMapping | dict[str, Any]]:
@@ -197,6 +229,7 @@ def create_ui() -> list[UiPage | dict[str, Any]]:
 
 if __name__ == "__main__":
     logging.basicConfig()
+    logging.getLogger("ucapi").setLevel(logging.DEBUG)
 
     entity = ucapi.Remote(
         "remote1",
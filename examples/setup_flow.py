@@ -1,13 +1,13 @@
 #!/usr/bin/env python3
 """Integration setup flow example."""
-import asyncio
 import logging
 from typing import Any
 
 import ucapi
 
-loop = asyncio.get_event_loop()
-api = ucapi.IntegrationAPI(loop)
+loop = ucapi.new_event_loop()
+# This example is ready all the time: the device state is always CONNECTED
+api = ucapi.IntegrationAPI(loop, default_device_state=ucapi.DeviceStates.CONNECTED)
 
 
 async def driver_setup_handler(msg: ucapi.SetupDriver) -> ucapi.SetupAction:
@@ -174,14 +174,9 @@ async def cmd_handler(
     return ucapi.StatusCodes.OK
 
 
-@api.listens_to(ucapi.Events.CONNECT)
-async def on_connect() -> None:
-    # When the remote connects, we just set the device state. We are ready all the time!
-    await api.set_device_state(ucapi.DeviceStates.CONNECTED)
-
-
 if __name__ == "__main__":
     logging.basicConfig()
+    logging.getLogger("ucapi").setLevel(logging.DEBUG)
 
     loop.run_until_complete(api.init("setup_flow.json", driver_setup_handler))
     loop.run_forever()
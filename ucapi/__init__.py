@@ -27,7 +27,7 @@ from .api_definitions import (  # isort:skip # noqa: F401
 )
 from .entity import Entity, EntityTypes  # isort:skip # noqa: F401
 from .entities import Entities  # isort:skip # noqa: F401
-from .api import IntegrationAPI  # isort:skip # noqa: F401
+from .api import IntegrationAPI, new_event_loop  # isort:skip # noqa: F401
 
 # Entity types
 from .button import Button  # noqa: F401
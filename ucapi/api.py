@@ -11,54 +11,155 @@ import logging
 import os
 import socket
 from asyncio import AbstractEventLoop
-from typing import Any, Callable
+from functools import cache, partial
+from typing import Any, Awaitable, Callable
 
 import websockets
-from pyee.asyncio import AsyncIOEventEmitter
 
 # workaround for pylint error: E0611: No name 'ConnectionClosedOK' in module 'websockets' (no-name-in-module)  # noqa
 from websockets.exceptions import ConnectionClosedOK
 
+# The server uses the legacy implementation: the top-level websockets.broadcast
+# refers to the new asyncio implementation in websockets 14+, which doesn't work with
+# legacy connections.
+from websockets.legacy.protocol import broadcast
+
 # workaround for pylint error: E1101: Module 'websockets' has no 'serve' member (no-member)  # noqa
-from websockets.server import serve
+from websockets.server import WebSocketServer, serve
 from zeroconf import IPVersion
 from zeroconf.asyncio import AsyncServiceInfo, AsyncZeroconf
 
 import ucapi.api_definitions as uc
 from ucapi import media_player
 from ucapi.entities import Entities
+from ucapi.event_emitter import EventEmitter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 _LOG = logging.getLogger(__name__)
-_LOG.setLevel(logging.DEBUG)
+
+# Delay in seconds to coalesce rapid device state changes into a single event
+_DEVICE_STATE_DEBOUNCE_DELAY = 0.01
+# Delay in seconds to coalesce attribute updates of an entity into a single event
+_ENTITY_CHANGE_DEBOUNCE_DELAY = 0.02
 
 
 class IntegrationAPI:
     """Integration API to communicate with Remote Two."""
 
-    def __init__(self, loop: AbstractEventLoop):
+    __slots__ = (
+        "_batch_writes",
+        "_corked_clients",
+        "_events",
+        "_setup_handler",
+        "_driver_info",
+        "_driver_path",
+        "_driver_version",
+        "_state",
+        "_send_state_on_connect",
+        "_device_state_task",
+        "_entity_changes",
+        "_entity_changes_task",
+        "_server_task",
+        "_server",
+        "_zeroconf",
+        "_service_info",
+        "_clients",
+        "_config_dir_path",
+        "_available_entities",
+        "_configured_entities",
+        "_req_handlers",
+        "_event_handlers",
+    )
+
+    def __init__(
+        self,
+        loop: AbstractEventLoop | None = None,
+        batch_writes: bool = False,
+        default_device_state: uc.DeviceStates | None = None,
+    ):
         """
         Create an integration driver API instance.
 
-        :param loop: event loop
+        :param loop: optional event loop for event callback handlers. Defaults to the
+               running event loop, which is handed over to the entity storages in
+               ``init``. Without a loop, ``update_attributes`` of the entity storages
+               therefore requires a running event loop until ``init`` is called.
+        :param batch_writes: coalesce WebSocket messages, which are sent to a client
+               within the same event loop iteration, into fewer TCP segments.
+               Only supported on Linux (TCP_CORK), ignored on other platforms.
+        :param default_device_state: optional initial device state. If set, the
+               current device state is automatically sent to Remote Two when it
+               connects. A ``CONNECT`` event handler setting the device state is then
+               no longer required.
         """
-        self._loop = loop
-        self._events = AsyncIOEventEmitter(self._loop)
+        self._batch_writes = batch_writes and hasattr(socket, "TCP_CORK")
+        self._corked_clients = set()
+        self._events = EventEmitter(loop)
         self._setup_handler: uc.SetupHandler | None = None
         self._driver_info: dict[str, Any] = {}
         self._driver_path: str | None = None
-        self._state: uc.DeviceStates = uc.DeviceStates.DISCONNECTED
+        self._driver_version: dict[str, Any] = {}
+        self._state: uc.DeviceStates = (
+            default_device_state or uc.DeviceStates.DISCONNECTED
+        )
+        self._send_state_on_connect = default_device_state is not None
+        self._device_state_task: asyncio.Task | None = None
+        # pending attribute changes: entity_id -> (entity_type, attributes)
+        self._entity_changes: dict[str, tuple[str, dict[str, Any]]] = {}
+        self._entity_changes_task: asyncio.Task | None = None
         self._server_task = None
+        self._server: WebSocketServer | None = None
+        self._zeroconf: AsyncZeroconf | None = None
+        self._service_info: AsyncServiceInfo | None = None
         self._clients = set()
 
         self._config_dir_path: str = (
             os.getenv("UC_CONFIG_HOME") or os.getenv("HOME") or "./"
         )
 
-        self._available_entities = Entities("available", self._loop)
-        self._configured_entities = Entities("configured", self._loop)
+        self._available_entities = Entities("available", loop)
+        self._configured_entities = Entities("configured", loop)
+
+        # WebSocket message dispatch tables: message name -> handler
+        self._req_handlers: dict[
+            str, Callable[[Any, int, dict[str, Any] | None], Awaitable[None]]
+        ] = {
+            uc.WsMessages.GET_DRIVER_VERSION: self._handle_get_driver_version,
+            uc.WsMessages.GET_DEVICE_STATE: self._handle_get_device_state,
+            uc.WsMessages.GET_AVAILABLE_ENTITIES: self._handle_get_available_entities,
+            uc.WsMessages.GET_ENTITY_STATES: self._handle_get_entity_states,
+            uc.WsMessages.ENTITY_COMMAND: self._entity_command,
+            uc.WsMessages.SUBSCRIBE_EVENTS: self._handle_subscribe_events,
+            uc.WsMessages.UNSUBSCRIBE_EVENTS: self._handle_unsubscribe_events,
+            uc.WsMessages.GET_DRIVER_METADATA: self._handle_get_driver_metadata,
+            uc.WsMessages.SETUP_DRIVER: self._handle_setup_driver,
+            uc.WsMessages.SET_DRIVER_USER_DATA: self._handle_set_driver_user_data,
+        }
+        self._event_handlers: dict[
+            str, Callable[[Any, dict[str, Any] | None], Awaitable[None]]
+        ] = {
+            uc.WsMsgEvents.CONNECT: self._handle_connect_event,
+            uc.WsMsgEvents.DISCONNECT: partial(self._emit_event, uc.Events.DISCONNECT),
+            uc.WsMsgEvents.ENTER_STANDBY: partial(
+                self._emit_event, uc.Events.ENTER_STANDBY
+            ),
+            uc.WsMsgEvents.EXIT_STANDBY: partial(
+                self._emit_event, uc.Events.EXIT_STANDBY
+            ),
+            uc.WsMsgEvents.ABORT_DRIVER_SETUP: self._handle_abort_driver_setup,
+        }
 
-        # Setup event loop
-        asyncio.set_event_loop(self._loop)
+        if batch_writes and not self._batch_writes:
+            _LOG.warning("Batched writes are not supported on this platform")
 
     async def init(
         self, driver_path: str, setup_handler: uc.SetupHandler | None = None
@@ -77,30 +178,47 @@ class IntegrationAPI:
             uc.Events.ENTITY_ATTRIBUTES_UPDATED, self._on_entity_attributes_updated
         )
 
-        # Load driver config
-        with open(self._driver_path, "r", encoding="utf-8") as file:
-            self._driver_info = json.load(file)
+        # Coroutine event handlers need an event loop: use the running one if no loop
+        # was given, since callers may emit events before the loop is running again.
+        loop = asyncio.get_running_loop()
+        for events in (
+            self._events,
+            self._available_entities,
+            self._configured_entities,
+        ):
+            if events.loop is None:
+                events.loop = loop
+
+        # Load driver config without blocking the event loop
+        self._driver_info = await loop.run_in_executor(
+            None, _load_json_file, self._driver_path
+        )
 
         # publishing interface, defaults to "0.0.0.0" if not set
         interface = os.getenv("UC_INTEGRATION_INTERFACE")
-        if os.getenv("UC_INTEGRATION_HTTP_PORT"):
-            port = int(os.getenv("UC_INTEGRATION_HTTP_PORT"))
+        if http_port := os.getenv("UC_INTEGRATION_HTTP_PORT"):
+            port = int(http_port)
         else:
-            port = self._driver_info["port"] if "port" in self._driver_info else 9090
+            port = self._driver_info.get("port", 9090)
 
         _adjust_driver_url(self._driver_info, port)
 
-        disable_mdns_publish = os.getenv(
-            "UC_DISABLE_MDNS_PUBLISH", "false"
-        ).lower() in ("true", "1")
+        driver_name = _get_default_language_string(
+            self._driver_info["name"], "Unknown driver"
+        )
+        # driver version response doesn't change after loading the driver metadata
+        self._driver_version = {
+            "name": driver_name,
+            "version": {
+                "api": self._driver_info["min_core_api"],
+                "driver": self._driver_info["version"],
+            },
+        }
 
-        if disable_mdns_publish is False:
+        if not _getenv_bool("UC_DISABLE_MDNS_PUBLISH"):
             # Setup zeroconf service info
             name = f"{self._driver_info['driver_id']}._uc-integration._tcp.local."
             hostname = local_hostname()
-            driver_name = _get_default_language_string(
-                self._driver_info["name"], "Unknown driver"
-            )
 
             _LOG.debug("Publishing driver: name=%s, host=%s:%d", name, hostname, port)
 
@@ -116,13 +234,17 @@ class IntegrationAPI:
                 },
                 server=hostname,
             )
-            zeroconf = AsyncZeroconf(ip_version=IPVersion.V4Only)
-            await zeroconf.async_register_service(info)
+            # the zeroconf instance is kept to reuse its multicast sockets and to
+            # unregister the service in close()
+            if self._zeroconf is None:
+                self._zeroconf = AsyncZeroconf(ip_version=IPVersion.V4Only)
+            elif self._service_info is not None:
+                await self._zeroconf.async_unregister_service(self._service_info)
+            self._service_info = info
+            await self._zeroconf.async_register_service(info)
 
         host = interface if interface is not None else "0.0.0.0"
-        self._server_task = self._loop.create_task(
-            self._start_web_socket_server(host, port)
-        )
+        self._server_task = loop.create_task(self._start_web_socket_server(host, port))
 
         _LOG.info(
             "Driver is up: %s, version: %s, listening on: %s:%d",
@@ -133,19 +255,72 @@ class IntegrationAPI:
         )
 
     async def _on_entity_attributes_updated(self, entity_id, entity_type, attributes):
-        data = {
-            "entity_id": entity_id,
-            "entity_type": entity_type,
-            "attributes": attributes,
-        }
+        # Coalesce attribute updates of an entity made in short succession, e.g. state,
+        # volume and media position of a media player, into one entity_change event.
+        if (change := self._entity_changes.get(entity_id)) is not None:
+            change[1].update(attributes)
+        else:
+            self._entity_changes[entity_id] = (entity_type, dict(attributes))
 
-        await self._broadcast_ws_event(
-            uc.WsMsgEvents.ENTITY_CHANGE, data, uc.EventCategory.ENTITY
-        )
+        if self._entity_changes_task is None:
+            self._entity_changes_task = asyncio.get_running_loop().create_task(
+                self._broadcast_entity_changes()
+            )
+
+    async def _broadcast_entity_changes(self) -> None:
+        await asyncio.sleep(_ENTITY_CHANGE_DEBOUNCE_DELAY)
+        self._entity_changes_task = None
+        await self._send_entity_changes()
+
+    async def _send_entity_changes(self) -> None:
+        changes = self._entity_changes
+        self._entity_changes = {}
+
+        for entity_id, (entity_type, attributes) in changes.items():
+            data = {
+                "entity_id": entity_id,
+                "entity_type": entity_type,
+                "attributes": attributes,
+            }
+
+            await self._broadcast_ws_event(
+                uc.WsMsgEvents.ENTITY_CHANGE, data, uc.EventCategory.ENTITY
+            )
 
     async def _start_web_socket_server(self, host: str, port: int) -> None:
-        async with serve(self._handle_ws, host, port):
-            await asyncio.Future()
+        # Compression is disabled: messages are mostly small JSON frames in a local
+        # network, and the only large payloads are already compressed base64 images.
+        self._server = await serve(self._handle_ws, host, port, compression=None)
+        await self._server.wait_closed()
+
+    async def close(self) -> None:
+        """
+        Stop the integration-API WebSocket server and the mDNS service announcement.
+
+        Pending device state and entity change notifications are sent before all client
+        connections are closed.
+        """
+        if self._device_state_task is not None:
+            self._device_state_task.cancel()
+            self._device_state_task = None
+            await self._send_device_state()
+        if self._entity_changes_task is not None:
+            self._entity_changes_task.cancel()
+            self._entity_changes_task = None
+            await self._send_entity_changes()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        elif self._server_task is not None:
+            self._server_task.cancel()
+        self._server_task = None
+
+        if self._zeroconf is not None:
+            # unregisters all services
+            await self._zeroconf.async_close()
+            self._zeroconf = None
+            self._service_info = None
 
     async def _handle_ws(self, websocket) -> None:
         try:
@@ -169,7 +344,7 @@ class IntegrationAPI:
             _LOG.error("WS: Connection closed due to processing error: %s", e)
 
         finally:
-            self._clients.remove(websocket)
+            self._clients.discard(websocket)
             _LOG.info("WS: Client removed")
             self._events.emit(uc.Events.DISCONNECT)
 
@@ -182,9 +357,6 @@ class IntegrationAPI:
         :param websocket: client connection
         :param req_id: request message identifier
         :param msg_data: message data payload
-
-        Raises:
-            websockets.ConnectionClosed: When the connection is closed.
         """
         await self._send_ws_response(
             websocket, req_id, "result", msg_data, uc.StatusCodes.OK
@@ -204,9 +376,6 @@ class IntegrationAPI:
         :param req_id: request message identifier
         :param status_code: status code
         :param msg_data: message data payload
-
-        Raises:
-            websockets.ConnectionClosed: When the connection is closed.
         """
         await self._send_ws_response(websocket, req_id, "result", msg_data, status_code)
 
@@ -226,24 +395,40 @@ class IntegrationAPI:
         :param msg: message name
         :param msg_data: message data payload
         :param status_code: status code
-
-        Raises:
-            websockets.ConnectionClosed: When the connection is closed.
         """
         data = {
             "kind": "resp",
             "req_id": req_id,
-            "code": int(status_code),
+            "code": status_code,
             "msg": msg,
             "msg_data": msg_data if msg_data is not None else {},
         }
 
-        if websocket in self._clients:
-            data_dump = json.dumps(data)
-            _LOG.debug("[%s] ->: %s", websocket.remote_address, data_dump)
+        await self._send_ws_message(websocket, data, _json_dumps(data))
+
+    async def _send_ws_message(
+        self, websocket, data: dict[str, Any], data_dump: str
+    ) -> None:
+        """
+        Send a serialized WebSocket message.
+
+        If the client is no longer connected, a log message is printed.
+
+        :param websocket: client connection
+        :param data: message, only used for logging
+        :param data_dump: serialized message
+        """
+        if _LOG.isEnabledFor(logging.DEBUG):
+            data_log = _log_msg_dump(data, data_dump)
+            _LOG.debug("[%s] ->: %s", websocket.remote_address, data_log)
+        try:
+            self._cork_socket(websocket)
             await websocket.send(data_dump)
-        else:
-            _LOG.error("Error sending response: connection no longer established")
+        except websockets.exceptions.ConnectionClosed:
+            _LOG.error(
+                "Error sending %s message: connection no longer established",
+                data["kind"],
+            )
 
     async def _broadcast_ws_event(
         self, msg: str, msg_data: dict[str, Any], category: uc.EventCategory
@@ -251,26 +436,34 @@ class IntegrationAPI:
         """
         Send the given event-message to all connected WebSocket clients.
 
-        If a client is no longer connected, a log message is printed and the remaining
-        clients are notified.
+        The message is serialized once and written to all open connections without
+        waiting for the individual clients. Clients which are no longer connected are
+        skipped.
 
         :param msg: event message name
         :param msg_data: message data payload
         :param category: event category
         """
-        data = {"kind": "event", "msg": msg, "msg_data": msg_data, "cat": category}
-        data_dump = json.dumps(data)
-        # filter fields
-        if _LOG.isEnabledFor(logging.DEBUG):
-            data_log = json.dumps(data) if filter_log_msg_data(data) else data_dump
+        if not self._clients:
+            # nobody to send to: don't serialize the event
+            return
 
-        for websocket in self._clients:
-            if _LOG.isEnabledFor(logging.DEBUG):
-                _LOG.debug("[%s] ->: %s", websocket.remote_address, data_log)
-            try:
-                await websocket.send(data_dump)
-            except websockets.exceptions.WebSocketException:
-                pass
+        data = {"kind": "event", "msg": msg, "msg_data": msg_data, "cat": category}
+        data_dump = _json_dumps(data)
+        debug = _LOG.isEnabledFor(logging.DEBUG)
+        if debug:
+            # filter fields
+            data_log = _log_msg_dump(data, data_dump)
+
+        # the client set is only walked if there's something to do per client
+        if debug or self._batch_writes:
+            cork_socket = self._cork_socket
+            for websocket in self._clients:
+                if debug:
+                    _LOG.debug("[%s] ->: %s", websocket.remote_address, data_log)
+                cork_socket(websocket)
+
+        broadcast(self._clients, data_dump)
 
     async def _send_ws_event(
         self, websocket, msg: str, msg_data: dict[str, Any], category: uc.EventCategory
@@ -282,29 +475,57 @@ class IntegrationAPI:
         :param msg: event message name
         :param msg_data: message data payload
         :param category: event category
-
-        Raises:
-            websockets.ConnectionClosed: When the connection is closed.
         """
         data = {"kind": "event", "msg": msg, "msg_data": msg_data, "cat": category}
-        data_dump = json.dumps(data)
 
-        if websocket in self._clients:
-            if _LOG.isEnabledFor(logging.DEBUG):
-                data_log = json.dumps(data) if filter_log_msg_data(data) else data_dump
-                _LOG.debug("[%s] ->: %s", websocket.remote_address, data_log)
-            await websocket.send(data_dump)
-        else:
-            _LOG.error("Error sending event: connection no longer established")
+        await self._send_ws_message(websocket, data, _json_dumps(data))
+
+    def _cork_socket(self, websocket) -> None:
+        """
+        Cork the client socket until the next event loop iteration.
+
+        All messages sent to the client in the current event loop iteration are
+        combined into as few TCP segments as possible. The socket is uncorked with the
+        next event loop iteration, which flushes the pending data.
+
+        Nothing is done if batched writes are disabled or not supported.
+
+        :param websocket: client connection
+        """
+        if not self._batch_writes or websocket in self._corked_clients:
+            return
+
+        transport = websocket.transport
+        sock = transport.get_extra_info("socket") if transport else None
+        if sock is None:
+            return
+
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 1)
+        except OSError as e:
+            _LOG.debug("Cannot cork client socket: %s", e)
+            return
+
+        self._corked_clients.add(websocket)
+        asyncio.get_running_loop().call_soon(self._uncork_socket, websocket, sock)
+
+    def _uncork_socket(self, websocket, sock) -> None:
+        self._corked_clients.discard(websocket)
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 0)
+        except OSError:
+            # socket already closed
+            pass
 
     async def _process_ws_message(self, websocket, message) -> None:
-        _LOG.debug("[%s] <-: %s", websocket.remote_address, message)
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("[%s] <-: %s", websocket.remote_address, message)
 
-        data = json.loads(message)
+        data = _json_loads(message)
         kind = data["kind"]
-        req_id = data["id"] if "id" in data else None
+        req_id = data.get("id")
         msg = data["msg"]
-        msg_data = data["msg_data"] if "msg_data" in data else None
+        msg_data = data.get("msg_data")
 
         if kind == "req":
             if req_id is None:
@@ -314,120 +535,177 @@ class IntegrationAPI:
             else:
                 await self._handle_ws_request_msg(websocket, msg, req_id, msg_data)
         elif kind == "event":
-            await self._handle_ws_event_msg(msg, msg_data)
+            await self._handle_ws_event_msg(websocket, msg, msg_data)
 
     async def _handle_ws_request_msg(
         self, websocket, msg: str, req_id: int, msg_data: dict[str, Any] | None
     ) -> None:
-        if msg == uc.WsMessages.GET_DRIVER_VERSION:
-            await self._send_ws_response(
-                websocket,
-                req_id,
-                uc.WsMsgEvents.DRIVER_VERSION,
-                self.get_driver_version(),
+        handler = self._req_handlers.get(msg)
+        if handler is None:
+            _LOG.debug(
+                "[%s] Ignoring unknown request: %s", websocket.remote_address, msg
             )
-        elif msg == uc.WsMessages.GET_DEVICE_STATE:
-            await self._send_ws_response(
+            return
+        await handler(websocket, req_id, msg_data)
+
+    async def _handle_get_driver_version(
+        self, websocket, req_id: int, _msg_data: dict[str, Any] | None
+    ) -> None:
+        await self._send_ws_response(
+            websocket,
+            req_id,
+            uc.WsMsgEvents.DRIVER_VERSION,
+            self.get_driver_version(),
+        )
+
+    async def _handle_get_device_state(
+        self, websocket, req_id: int, _msg_data: dict[str, Any] | None
+    ) -> None:
+        await self._send_ws_response(
+            websocket,
+            req_id,
+            uc.WsMsgEvents.DEVICE_STATE,
+            {"state": self.device_state},
+        )
+
+    async def _handle_get_available_entities(
+        self, websocket, req_id: int, _msg_data: dict[str, Any] | None
+    ) -> None:
+        available_entities = self._available_entities.get_all()
+        await self._send_ws_response(
+            websocket,
+            req_id,
+            uc.WsMsgEvents.AVAILABLE_ENTITIES,
+            {"available_entities": available_entities},
+        )
+
+    async def _handle_get_entity_states(
+        self, websocket, req_id: int, _msg_data: dict[str, Any] | None
+    ) -> None:
+        entity_states = await self._configured_entities.get_states()
+        await self._send_ws_response(
+            websocket,
+            req_id,
+            uc.WsMsgEvents.ENTITY_STATES,
+            entity_states,
+        )
+
+    async def _handle_subscribe_events(
+        self, websocket, req_id: int, msg_data: dict[str, Any] | None
+    ) -> None:
+        await self._subscribe_events(msg_data)
+        await self._send_ok_result(websocket, req_id)
+
+    async def _handle_unsubscribe_events(
+        self, websocket, req_id: int, msg_data: dict[str, Any] | None
+    ) -> None:
+        await self._unsubscribe_events(msg_data)
+        await self._send_ok_result(websocket, req_id)
+
+    async def _handle_get_driver_metadata(
+        self, websocket, req_id: int, _msg_data: dict[str, Any] | None
+    ) -> None:
+        await self._send_ws_response(
+            websocket, req_id, uc.WsMsgEvents.DRIVER_METADATA, self._driver_info
+        )
+
+    async def _handle_setup_driver(
+        self, websocket, req_id: int, msg_data: dict[str, Any] | None
+    ) -> None:
+        if not await self._setup_driver(websocket, req_id, msg_data):
+            # sleep for web-configurator quirks...
+            await asyncio.sleep(0.5)
+            await self.driver_setup_error(websocket)
+
+    async def _handle_set_driver_user_data(
+        self, websocket, req_id: int, msg_data: dict[str, Any] | None
+    ) -> None:
+        if not await self._set_driver_user_data(websocket, req_id, msg_data):
+            await asyncio.sleep(0.5)
+            await self.driver_setup_error(websocket)
+
+    async def _handle_ws_event_msg(
+        self, websocket, msg: str, msg_data: dict[str, Any] | None
+    ) -> None:
+        handler = self._event_handlers.get(msg)
+        if handler is None:
+            _LOG.debug("[%s] Ignoring unknown event: %s", websocket.remote_address, msg)
+            return
+        await handler(websocket, msg_data)
+
+    async def _emit_event(
+        self, event: uc.Events, _websocket, _msg_data: dict[str, Any] | None
+    ) -> None:
+        self._events.emit(event)
+
+    async def _handle_connect_event(
+        self, websocket, _msg_data: dict[str, Any] | None
+    ) -> None:
+        if self._send_state_on_connect:
+            await self._send_ws_event(
                 websocket,
-                req_id,
                 uc.WsMsgEvents.DEVICE_STATE,
                 {"state": self.device_state},
+                uc.EventCategory.DEVICE,
             )
-        elif msg == uc.WsMessages.GET_AVAILABLE_ENTITIES:
-            available_entities = self._available_entities.get_all()
-            await self._send_ws_response(
-                websocket,
-                req_id,
-                uc.WsMsgEvents.AVAILABLE_ENTITIES,
-                {"available_entities": available_entities},
-            )
-        elif msg == uc.WsMessages.GET_ENTITY_STATES:
-            entity_states = await self._configured_entities.get_states()
-            await self._send_ws_response(
-                websocket,
-                req_id,
-                uc.WsMsgEvents.ENTITY_STATES,
-                entity_states,
-            )
-        elif msg == uc.WsMessages.ENTITY_COMMAND:
-            await self._entity_command(websocket, req_id, msg_data)
-        elif msg == uc.WsMessages.SUBSCRIBE_EVENTS:
-            await self._subscribe_events(msg_data)
-            await self._send_ok_result(websocket, req_id)
-        elif msg == uc.WsMessages.UNSUBSCRIBE_EVENTS:
-            await self._unsubscribe_events(msg_data)
-            await self._send_ok_result(websocket, req_id)
-        elif msg == uc.WsMessages.GET_DRIVER_METADATA:
-            await self._send_ws_response(
-                websocket, req_id, uc.WsMsgEvents.DRIVER_METADATA, self._driver_info
-            )
-        elif msg == uc.WsMessages.SETUP_DRIVER:
-            if not await self._setup_driver(websocket, req_id, msg_data):
-                # sleep for web-configurator quirks...
-                await asyncio.sleep(0.5)
-                await self.driver_setup_error(websocket)
-        elif msg == uc.WsMessages.SET_DRIVER_USER_DATA:
-            if not await self._set_driver_user_data(websocket, req_id, msg_data):
-                await asyncio.sleep(0.5)
-                await self.driver_setup_error(websocket)
+        self._events.emit(uc.Events.CONNECT)
 
-    async def _handle_ws_event_msg(
-        self, msg: str, msg_data: dict[str, Any] | None
+    async def _handle_abort_driver_setup(
+        self, _websocket, msg_data: dict[str, Any] | None
     ) -> None:
-        if msg == uc.WsMsgEvents.CONNECT:
-            self._events.emit(uc.Events.CONNECT)
-        elif msg == uc.WsMsgEvents.DISCONNECT:
-            self._events.emit(uc.Events.DISCONNECT)
-        elif msg == uc.WsMsgEvents.ENTER_STANDBY:
-            self._events.emit(uc.Events.ENTER_STANDBY)
-        elif msg == uc.WsMsgEvents.EXIT_STANDBY:
-            self._events.emit(uc.Events.EXIT_STANDBY)
-        elif msg == uc.WsMsgEvents.ABORT_DRIVER_SETUP:
-            if not self._setup_handler:
-                _LOG.warning(
-                    "Received abort_driver_setup event, but no setup handler provided by the driver!"
-                )  # noqa
-                return
-
-            if "error" in msg_data:
-                try:
-                    error = uc.IntegrationSetupError[msg_data["error"]]
-                except KeyError:
-                    error = uc.IntegrationSetupError.OTHER
-                await self._setup_handler(uc.AbortDriverSetup(error))
-            else:
-                _LOG.warning(
-                    "Unsupported abort_driver_setup payload received: %s", msg_data
-                )
+        if not self._setup_handler:
+            _LOG.warning(
+                "Received abort_driver_setup event, but no setup handler provided by the driver!"
+            )  # noqa
+            return
+
+        if "error" in msg_data:
+            try:
+                error = uc.IntegrationSetupError[msg_data["error"]]
+            except KeyError:
+                error = uc.IntegrationSetupError.OTHER
+            await self._setup_handler(uc.AbortDriverSetup(error))
+        else:
+            _LOG.warning(
+                "Unsupported abort_driver_setup payload received: %s", msg_data
+            )
 
     async def _authenticate(self, websocket, success: bool) -> None:
-        await self._send_ws_response(
-            websocket,
-            0,
-            uc.WsMessages.AUTHENTICATION,
-            {},
-            uc.StatusCodes.OK if success else uc.StatusCodes.UNAUTHORIZED,
-        )
+        data, data_dump = _authentication_response(success)
+        await self._send_ws_message(websocket, data, data_dump)
 
     def get_driver_version(self) -> dict[str, dict[str, Any]]:
-        """Get driver version information."""
-        return {
-            "name": self._driver_info["name"]["en"],
-            "version": {
-                "api": self._driver_info["min_core_api"],
-                "driver": self._driver_info["version"],
-            },
-        }
+        """
+        Get driver version information.
+
+        The information is available after calling ``init``.
+        """
+        return self._driver_version
 
     async def set_device_state(self, state: uc.DeviceStates) -> None:
         """
         Set new device state and notify all connected clients.
 
+        The notification is sent shortly afterwards: rapid state changes are coalesced
+        and clients are only notified about the latest state.
+
         Attention: clients are always notified, even if the current state is the same as
-        the new state!
+        the new state! Returning from this method doesn't mean that clients have been
+        notified yet. A pending notification is sent when calling ``close()``.
         """
         self._state = state
 
+        if self._device_state_task is None:
+            self._device_state_task = asyncio.get_running_loop().create_task(
+                self._broadcast_device_state()
+            )
+
+    async def _broadcast_device_state(self) -> None:
+        await asyncio.sleep(_DEVICE_STATE_DEBOUNCE_DELAY)
+        self._device_state_task = None
+        await self._send_device_state()
+
+    async def _send_device_state(self) -> None:
         await self._broadcast_ws_event(
             uc.WsMsgEvents.DEVICE_STATE,
             {"state": self.device_state},
@@ -475,8 +753,8 @@ class IntegrationAPI:
             )
             return
 
-        entity_id = msg_data["entity_id"] if "entity_id" in msg_data else None
-        cmd_id = msg_data["cmd_id"] if "cmd_id" in msg_data else None
+        entity_id = msg_data.get("entity_id")
+        cmd_id = msg_data.get("cmd_id")
         if entity_id is None or cmd_id is None:
             _LOG.warning("Ignoring command: missing entity_id or cmd_id")
             await self.acknowledge_command(
@@ -494,9 +772,7 @@ class IntegrationAPI:
             await self.acknowledge_command(websocket, req_id, uc.StatusCodes.NOT_FOUND)
             return
 
-        result = await entity.command(
-            cmd_id, msg_data["params"] if "params" in msg_data else None
-        )
+        result = await entity.command(cmd_id, msg_data.get("params"))
         await self.acknowledge_command(websocket, req_id, result)
 
     async def _setup_driver(
@@ -560,7 +836,10 @@ class IntegrationAPI:
             )  # noqa
             return False
 
-        if "input_values" in msg_data or "confirm" in msg_data:
+        input_values = msg_data.get("input_values") if msg_data else None
+        confirm = msg_data.get("confirm") if msg_data else None
+
+        if input_values is not None or confirm is not None:
             # please don't ask, there's some funky stuff in the web-configurator :-(
             await asyncio.sleep(0.5)
             await self.driver_setup_progress(websocket)
@@ -573,14 +852,10 @@ class IntegrationAPI:
         result = False
         try:
             action = uc.SetupError()
-            if "input_values" in msg_data:
-                action = await self._setup_handler(
-                    uc.UserDataResponse(msg_data["input_values"])
-                )
-            elif "confirm" in msg_data:
-                action = await self._setup_handler(
-                    uc.UserConfirmationResponse(msg_data["confirm"])
-                )
+            if input_values is not None:
+                action = await self._setup_handler(uc.UserDataResponse(input_values))
+            elif confirm is not None:
+                action = await self._setup_handler(uc.UserConfirmationResponse(confirm))
 
             if isinstance(action, uc.RequestUserInput):
                 await self.request_driver_setup_user_input(
@@ -614,9 +889,6 @@ class IntegrationAPI:
         :param websocket: client connection
         :param req_id: request message identifier to acknowledge
         :param status_code: status code
-
-        Raises:
-            websockets.ConnectionClosed: When the connection is closed.
         """
         await self._send_ws_response(websocket, req_id, "result", {}, status_code)
 
@@ -625,15 +897,9 @@ class IntegrationAPI:
         Send a driver setup progress event to Remote Two.
 
         :param websocket: client connection
-
-        Raises:
-            websockets.ConnectionClosed: When the connection is closed.
         """
-        data = {"event_type": "SETUP", "state": "SETUP"}
-
-        await self._send_ws_event(
-            websocket, uc.WsMsgEvents.DRIVER_SETUP_CHANGE, data, uc.EventCategory.DEVICE
-        )
+        data, data_dump = _driver_setup_change_event("SETUP", "SETUP")
+        await self._send_ws_message(websocket, data, data_dump)
 
     async def request_driver_setup_user_confirmation(
         self,
@@ -651,9 +917,6 @@ class IntegrationAPI:
         :param msg1: optional header message
         :param image: optional image between header and footer
         :param msg2: optional footer message
-
-        Raises:
-            websockets.ConnectionClosed: When the connection is closed.
         """
         data = {
             "event_type": "SETUP",
@@ -690,19 +953,13 @@ class IntegrationAPI:
 
     async def driver_setup_complete(self, websocket) -> None:
         """Send a driver setup complete event to Remote Two."""
-        data = {"event_type": "STOP", "state": "OK"}
-
-        await self._send_ws_event(
-            websocket, uc.WsMsgEvents.DRIVER_SETUP_CHANGE, data, uc.EventCategory.DEVICE
-        )
+        data, data_dump = _driver_setup_change_event("STOP", "OK")
+        await self._send_ws_message(websocket, data, data_dump)
 
     async def driver_setup_error(self, websocket, error="OTHER") -> None:
         """Send a driver setup error event to Remote Two."""
-        data = {"event_type": "STOP", "state": "ERROR", "error": error}
-
-        await self._send_ws_event(
-            websocket, uc.WsMsgEvents.DRIVER_SETUP_CHANGE, data, uc.EventCategory.DEVICE
-        )
+        data, data_dump = _driver_setup_change_event("STOP", "ERROR", error)
+        await self._send_ws_message(websocket, data, data_dump)
 
     def add_listener(self, event: uc.Events, f: Callable) -> None:
         """
@@ -776,11 +1033,9 @@ class IntegrationAPI:
 
 
 def _to_language_object(text: str | dict[str, str] | None) -> dict[str, str] | None:
-    if text is None:
-        return None
     if isinstance(text, str):
         return {"en": text}
-
+    # language dictionary or None
     return text
 
 
@@ -789,18 +1044,18 @@ def _get_default_language_string(
 ) -> str:
     if text is None:
         return default_text
+    if isinstance(text, str):
+        return text
 
-    if "en" in text:
-        return text["en"]
-
-    for index, key, value in text.items():
-        if index == 0:
-            default_text = value
+    if (value := text.get("en")) is not None:
+        return value
 
+    for key, value in text.items():
         if key.startswith("en_"):
-            return text[key]
+            return value
 
-    return default_text
+    # fall back to the first available language
+    return next(iter(text.values()), default_text)
 
 
 def _adjust_driver_url(driver_info: dict[str, Any], port: int) -> str | None:
@@ -820,7 +1075,7 @@ def _adjust_driver_url(driver_info: dict[str, Any], port: int) -> str | None:
     :param port: WebSocket server port
     :return: adjusted driver url or None
     """
-    driver_url = driver_info["driver_url"] if "driver_url" in driver_info else None
+    driver_url = driver_info.get("driver_url")
 
     if driver_url is None:
         return None
@@ -833,6 +1088,16 @@ def _adjust_driver_url(driver_info: dict[str, Any], port: int) -> str | None:
     return driver_info["driver_url"]
 
 
+def _getenv_bool(key: str) -> bool:
+    """
+    Get a boolean environment variable.
+
+    :param key: environment variable name
+    :return: True if the variable is set to ``true`` or ``1`` (case-insensitive)
+    """
+    return os.getenv(key, "").lower() in ("true", "1")
+
+
 def local_hostname() -> str:
     """
     Get the local hostname for mDNS publishing.
@@ -852,12 +1117,111 @@ def local_hostname() -> str:
     )
 
 
+def new_event_loop() -> AbstractEventLoop:
+    """
+    Create a new event loop for running the integration driver.
+
+    The `uvloop <https://github.com/MagicStack/uvloop>`_ event loop is used if it is
+    installed, which considerably speeds up the WebSocket I/O. Otherwise, a default
+    asyncio event loop is created.
+
+    uvloop is an optional dependency and not available on Windows:
+    ``pip3 install ucapi[uvloop]``
+
+    Using uvloop can be disabled with environment variable ``UC_DISABLE_UVLOOP``.
+
+    :return: the new event loop
+    """
+    if uvloop is not None and not _getenv_bool("UC_DISABLE_UVLOOP"):
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def _json_dumps(data: Any) -> str:
+    """
+    Serialize the given data to a JSON string.
+
+    The optional orjson library is used if installed, which is considerably faster
+    than the json module of the standard library.
+    """
+    if orjson:
+        # entity attributes use str enums as dictionary keys
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data)
+
+
+def _json_loads(message: str | bytes) -> Any:
+    """
+    Deserialize a JSON message.
+
+    The optional orjson library is used if installed.
+    """
+    if orjson:
+        return orjson.loads(message)
+    return json.loads(message)
+
+
+@cache
+def _authentication_response(success: bool) -> tuple[dict[str, Any], str]:
+    """
+    Get the authentication response message.
+
+    The response is fixed, it is only created and serialized once.
+
+    :param success: authentication result
+    :return: tuple of the response message and its serialized form
+    """
+    data = {
+        "kind": "resp",
+        "req_id": 0,
+        "code": int(uc.StatusCodes.OK if success else uc.StatusCodes.UNAUTHORIZED),
+        "msg": uc.WsMessages.AUTHENTICATION,
+        "msg_data": {},
+    }
+    return data, _json_dumps(data)
+
+
+@cache
+def _driver_setup_change_event(
+    event_type: str, state: str, error: str | None = None
+) -> tuple[dict[str, Any], str]:
+    """
+    Get a driver setup change event message without user action.
+
+    These events only depend on the given parameters, they are only created and
+    serialized once.
+
+    :param event_type: setup event type
+    :param state: setup state
+    :param error: optional error reason
+    :return: tuple of the event message and its serialized form
+    """
+    msg_data = {"event_type": event_type, "state": state}
+    if error is not None:
+        msg_data["error"] = error
+    data = {
+        "kind": "event",
+        "msg": uc.WsMsgEvents.DRIVER_SETUP_CHANGE,
+        "msg_data": msg_data,
+        "cat": uc.EventCategory.DEVICE,
+    }
+    return data, _json_dumps(data)
+
+
+def _load_json_file(path: str) -> Any:
+    """Read and deserialize the given JSON file."""
+    with open(path, "rb") as file:
+        return _json_loads(file.read())
+
+
 def filter_log_msg_data(data: dict[str, Any]) -> bool:
     """
     Filter attribute fields to exclude for log messages in the given msg data dict.
 
     Attention: the dictionary is modified!
 
+    Deprecated: no longer used by the library, which filters log messages on a copy.
+
     - Attributes are filtered in `data["msg_data"]["attributes"]`
     - Filtered attributes: `MEDIA_IMAGE_URL`
 
@@ -876,3 +1240,75 @@ def filter_log_msg_data(data: dict[str, Any]) -> bool:
         data["msg_data"]["attributes"][media_player.Attributes.MEDIA_IMAGE_URL] = "***"
         return True
     return False
+
+
+def _filter_log_msg_data(data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Filter attribute fields to exclude for log messages in the given msg data dict.
+
+    The given dictionary is not modified. If nothing has to be filtered, it is
+    returned as is. Otherwise, a copy is returned, where only the dictionaries on the
+    path to the filtered attributes are copied.
+
+    - Attributes are filtered in `data["msg_data"]["attributes"]` and, for a list
+      payload, in `data["msg_data"][i]["attributes"]`
+    - Filtered attributes: `MEDIA_IMAGE_URL`
+
+    :param data: the message data dict
+    :return: the filtered message data dict
+    """
+    msg_data = data.get("msg_data")
+
+    if isinstance(msg_data, dict):
+        filtered = _filter_log_attributes(msg_data)
+        if filtered is msg_data:
+            return data
+        return {**data, "msg_data": filtered}
+
+    if isinstance(msg_data, list):
+        for index, item in enumerate(msg_data):
+            filtered = _filter_log_attributes(item)
+            if filtered is not item:
+                # first hit: copy the list and filter the remaining items
+                msg_data = msg_data.copy()
+                msg_data[index] = filtered
+                for i in range(index + 1, len(msg_data)):
+                    msg_data[i] = _filter_log_attributes(msg_data[i])
+                return {**data, "msg_data": msg_data}
+
+    return data
+
+
+def _filter_log_attributes(item: Any) -> Any:
+    """
+    Filter the attributes of a single entity item for log messages.
+
+    :param item: entity item with an optional ``attributes`` dict
+    :return: the item as is if nothing was filtered, otherwise a filtered copy
+    """
+    if not isinstance(item, dict):
+        return item
+    attributes = item.get("attributes")
+    if not isinstance(attributes, dict):
+        return item
+
+    # filter out base64 encoded images in the media player's media_image_url attribute
+    image_url = attributes.get(media_player.Attributes.MEDIA_IMAGE_URL)
+    if isinstance(image_url, str) and image_url.startswith("data:"):
+        attributes = {**attributes, media_player.Attributes.MEDIA_IMAGE_URL: "***"}
+        return {**item, "attributes": attributes}
+
+    return item
+
+
+def _log_msg_dump(data: dict[str, Any], data_dump: str) -> str:
+    """
+    Get the log representation of a WebSocket message.
+
+    :param data: the message data dict
+    :param data_dump: the serialized message of ``data``
+    :return: ``data_dump`` if no field was filtered, otherwise the serialized
+             filtered message
+    """
+    log_data = _filter_log_msg_data(data)
+    return data_dump if log_data is data else _json_dumps(log_data)
@@ -9,28 +9,28 @@ import logging
 from asyncio import AbstractEventLoop
 from typing import Any, Callable
 
-from pyee.asyncio import AsyncIOEventEmitter
-
 from ucapi.api_definitions import Events
 from ucapi.entity import Entity
+from ucapi.event_emitter import EventEmitter
 
 _LOG = logging.getLogger(__name__)
-_LOG.setLevel(logging.DEBUG)
 
 
 class Entities:
     """Simple entity storage."""
 
-    def __init__(self, identifier: str, loop: AbstractEventLoop):
+    def __init__(self, identifier: str, loop: AbstractEventLoop | None = None):
         """
         Create entity storage instance with the given identifier.
 
         :param identifier: storage identifier.
-        :param loop: event loop
+        :param loop: optional event loop for event callback handlers. Defaults to the
+               running event loop: ``update_attributes`` then requires a running event
+               loop to call coroutine callback handlers.
         """
         self._id: str = identifier
         self._storage = {}
-        self._events = AsyncIOEventEmitter(loop)
+        self._events = EventEmitter(loop)
 
     def contains(self, entity_id: str) -> bool:
         """Check if storage contains an entity with given identifier."""
@@ -174,3 +174,13 @@ class Entities:
     def id(self) -> str:
         """Return storage identifier."""
         return self._id
+
+    @property
+    def loop(self) -> AbstractEventLoop | None:
+        """Return the event loop for event callback handlers, None for the running loop."""
+        return self._events.loop
+
+    @loop.setter
+    def loop(self, loop: AbstractEventLoop | None) -> None:
+        """Set the event loop for event callback handlers, None for the running loop."""
+        self._events.loop = loop
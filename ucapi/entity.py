@@ -12,7 +12,6 @@ from typing import Any
 from ucapi.api_definitions import CommandHandler, StatusCodes
 
 _LOG = logging.getLogger(__name__)
-_LOG.setLevel(logging.DEBUG)
 
 
 class EntityTypes(str, Enum):
@@ -0,0 +1,132 @@
+"""
+Lightweight event emitter for the integration API.
+
+:copyright: (c) 2024 by Unfolded Circle ApS.
+:license: MPL-2.0, see LICENSE for more details.
+"""
+
+import asyncio
+import inspect
+import logging
+from asyncio import AbstractEventLoop
+from typing import Any, Callable
+
+_LOG = logging.getLogger(__name__)
+
+
+class EventEmitter:
+    """
+    Event emitter calling registered listeners on an asyncio event loop.
+
+    Listeners can be regular functions or coroutine functions. Regular functions are
+    called directly in ``emit``, coroutine functions are scheduled as a task on the
+    event loop. Without an event loop, coroutine listeners are skipped and an error is
+    logged.
+    """
+
+    def __init__(self, loop: AbstractEventLoop | None = None):
+        """
+        Create an event emitter instance.
+
+        :param loop: optional event loop to run coroutine listeners on. Defaults to the
+               running event loop when an event is emitted.
+        """
+        self._loop = loop
+        # Listener tuples are replaced instead of modified: emit doesn't need to copy
+        # them if a listener adds or removes listeners.
+        self._listeners: dict[Any, tuple[Callable, ...]] = {}
+        # keep a reference to running listener tasks to prevent garbage collection
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def loop(self) -> AbstractEventLoop | None:
+        """Get the event loop for coroutine listeners, None for the running loop."""
+        return self._loop
+
+    @loop.setter
+    def loop(self, loop: AbstractEventLoop | None) -> None:
+        """Set the event loop for coroutine listeners, None for the running loop."""
+        self._loop = loop
+
+    def add_listener(self, event: Any, f: Callable) -> None:
+        """
+        Register a listener for the given event.
+
+        Adding an already registered listener has no effect.
+
+        :param event: the event
+        :param f: callback handler
+        """
+        listeners = self._listeners.get(event, ())
+        if f not in listeners:
+            self._listeners[event] = listeners + (f,)
+
+    def remove_listener(self, event: Any, f: Callable) -> None:
+        """
+        Remove a listener from the given event.
+
+        :param event: the event
+        :param f: callback handler
+        """
+        listeners = tuple(x for x in self._listeners.get(event, ()) if x != f)
+        if listeners:
+            self._listeners[event] = listeners
+        else:
+            self._listeners.pop(event, None)
+
+    def remove_all_listeners(self, event: Any | None = None) -> None:
+        """
+        Remove all listeners attached to ``event``.
+
+        If ``event`` is ``None``, remove all listeners on all events.
+
+        :param event: the event
+        """
+        if event is None:
+            self._listeners.clear()
+        else:
+            self._listeners.pop(event, None)
+
+    def emit(self, event: Any, *args: Any) -> bool:
+        """
+        Call all listeners of the given event with the given arguments.
+
+        :param event: the event
+        :param args: listener arguments
+        :return: True if the event had listeners, False otherwise.
+        """
+        listeners = self._listeners.get(event)
+        if not listeners:
+            return False
+
+        loop = self._loop
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+
+        for f in listeners:
+            if loop is None and inspect.iscoroutinefunction(f):
+                _LOG.error(
+                    "Cannot call listener %s of event %s: no event loop", f, event
+                )
+                continue
+            result = f(*args)
+            if asyncio.iscoroutine(result):
+                if loop is None:
+                    result.close()
+                    _LOG.error(
+                        "Cannot call listener %s of event %s: no event loop", f, event
+                    )
+                    continue
+                task = loop.create_task(result)
+                self._tasks.add(task)
+                task.add_done_callback(self._on_task_done)
+
+        return True
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and (ex := task.exception()) is not None:
+            _LOG.error("Error in event listener: %s", ex, exc_info=ex)